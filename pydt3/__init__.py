@@ -3,3 +3,11 @@
 
 from .apps.devonthink import DEVONthink3
 from .osascript import OSAScript
+
+
+def __getattr__(name):
+    # The asyncio interface pulls in asyncio and threading, so it is only imported when used
+    if name == 'AsyncApplication':
+        from .async_proxy import AsyncApplication
+        return AsyncApplication
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -6,6 +6,7 @@ from typing import Optional
 
 from .objproxy import DefaultOSAObjProxy
 from .helper_bridging import HelperScript
+from .utils import weak_lru
 
 
 class Application(DefaultOSAObjProxy):
@@ -34,6 +35,14 @@ class Application(DefaultOSAObjProxy):
             super().__init__(helper_script, app.obj_id, app.class_name)
         else:
             raise ValueError('`name` or `helper_script`, `obj_id`, `class_name` must be provided')
+
+    @weak_lru(maxsize=128)
+    def _call_immutable_method(self, name: str, bind_version: int):
+        """Call a method whose result never changes for the bound object.
+
+        `bind_version` is part of the cache key so that rebinding the proxy invalidates the result.
+        """
+        return self._call_method(name)
     
     @property
     def id(self) -> str:
@@ -42,7 +51,7 @@ class Application(DefaultOSAObjProxy):
         Returns:
             str: Application's unique identifier
         """
-        return self._call_method('id')
+        return self._call_immutable_method('id', self._bind_version)
 
     @property
     def name(self) -> str:
@@ -51,7 +60,8 @@ class Application(DefaultOSAObjProxy):
         Returns:
             str: Application's name
         """
-        return self._call_method('name') # The name is a function so it needs special handling
+        # The name is a function so it needs special handling
+        return self._call_immutable_method('name', self._bind_version)
 
     @property
     def frontmost(self) -> bool:
@@ -63,8 +73,11 @@ class Application(DefaultOSAObjProxy):
         return self._call_method('frontmost')
 
     def activate(self):
-        """Activate the application (bring it to front)."""
-        return self._call_method('activate')
+        """Activate the application (bring it to front).
+
+        Does not wait for the application to respond when the helper script can pipeline calls.
+        """
+        self._call_method_async('activate')
 
 # Register Application class as the default handler for application objects
 HelperScript.set_default_class_map({
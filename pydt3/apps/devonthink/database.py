@@ -7,6 +7,8 @@ from .smartgroup import SmartGroup
 from. taggroup import TagGroup
 
 class Database(OSAObjProxy):
+    __slots__ = ()
+
     # elements
     @property
     def contents(self) -> OSAObjArray['Record']:
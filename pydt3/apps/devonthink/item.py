@@ -3,4 +3,4 @@ from ...osascript import OSAScript
 from ...helper_bridging import OSAObjProxy
 
 class Item(OSAObjProxy):
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
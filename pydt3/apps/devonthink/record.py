@@ -43,6 +43,8 @@ class CustomMetaData:
         return f'<{type(self).__name__}: {self.get_dict_value()}>'
 
 class Record(OSAObjProxy):
+    __slots__ = ()
+
     # elements
     @property
     def children(self) -> OSAObjArray['Record']:
@@ -2,6 +2,8 @@ from .record import Record
 from ...osascript import  OSAScript
 
 class SmartGroup(Record):
+    __slots__ = ()
+
     # properties
     @property
     def exclude_subgroups(self) -> bool:
@@ -6,6 +6,8 @@ if TYPE_CHECKING:
     from ..devonthink import Record, Database, Text, ThinkWindow
 
 class Tab(OSAObjProxy):
+    __slots__ = ()
+
     @property
     def content_record(self) -> 'Record':
         """The record of the visible document."""
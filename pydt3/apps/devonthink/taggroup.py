@@ -1,4 +1,4 @@
 from ..devonthink.record import Record
 
 class TagGroup(Record):
-    pass
+    __slots__ = ()
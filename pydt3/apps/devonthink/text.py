@@ -4,6 +4,8 @@ from ...helper_bridging import OSAObjProxy
 from typing import List, TYPE_CHECKING
 
 class Text(OSAObjProxy):
+    __slots__ = ()
+
     def __str__(self) -> str:
         result = self()
         return result if result is not None else ''
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 
 
 class ThinkWindow(OSAObjProxy):
+    __slots__ = ()
+
     # elements
     @property
     def tabs(self) -> List['Tab']:
@@ -145,12 +147,16 @@ class ThinkWindow(OSAObjProxy):
         return self._call_method('webArchive')
 
 class DocumentWindow(ThinkWindow):
+    __slots__ = ()
+
     @property
     def record(self) -> 'Record':
         """The record of the visible document."""
         return self._get_property('record')
 
 class ViewerWindow(ThinkWindow):
+    __slots__ = ()
+
     # elements
     @property
     def selected_records(self) -> List['Record']:
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 class Account(OSAObjProxy):
     """A Mail account for receiving messages (POP/IMAP)."""
 
+    __slots__ = ()
+
     # ========== Elements ==========
     @property
     def mailboxes(self) -> OSAObjArray[Mailbox]:
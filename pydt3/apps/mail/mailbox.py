@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class Mailbox(OSAObjProxy):
     """A mailbox that holds messages."""
 
+    __slots__ = ()
+
     # ========== Elements ==========
     @property
     def mailboxes(self) -> OSAObjArray[Mailbox]:
@@ -5,6 +5,8 @@ from ...helper_bridging import OSAObjProxy, OSAObjArray
 class Message(OSAObjProxy):
     """An email message."""
 
+    __slots__ = ()
+
     # ========== Elements ==========
     @property
     def bcc_recipients(self) -> OSAObjArray[Recipient]:
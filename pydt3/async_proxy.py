@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import array
+import asyncio
+import logging
+import queue
+import threading
+
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from .helper_bridging import HelperScript, DEFAULT_SCRIPT_PATH
+from .objproxy import OSAObjProxy
+from .osascript import OSAScript
+
+
+logger = logging.getLogger(__name__)
+
+
+def _log_failure(future: Future):
+    """Log the error of a call made without waiting, since there is no caller to raise it to."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f'Call without waiting failed: {future.exception()}')
+
+
+class _ScriptWorker:
+    """A dedicated thread that runs jobs one at a time, in submission order.
+
+    NSAppleScript is not thread-safe, so every script owned by a worker is only
+    ever touched from the worker's thread.
+    """
+
+    def __init__(self):
+        self._jobs: queue.Queue = queue.Queue()
+        self._closed = False
+        self.thread = threading.Thread(target=self._run, name='pydt3-script-worker', daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            future, func, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Schedule `func(*args, **kwargs)` on the worker thread."""
+        if self._closed:
+            raise RuntimeError('The script worker has been closed')
+        future = Future()
+        self._jobs.put((future, func, args, kwargs))
+        return future
+
+    def close(self):
+        """Stop the worker thread once the queued jobs have run."""
+        self._closed = True
+        self._jobs.put(None)
+
+
+class ThreadedHelperScript(HelperScript):
+    """A helper script that is compiled and executed on its own worker thread.
+
+    Calls made from any other thread are forwarded to the worker and waited for, so
+    proxies created by this script can be used from anywhere. Each instance has its
+    own script and object pool, so independent instances run concurrently.
+    """
+
+    def __init__(self, script, osaobj_rc: Optional[array.array] = None, worker: Optional[_ScriptWorker] = None):
+        """Initialize the threaded helper script.
+
+        Args:
+            script: The compiled AppleScript/JXA script, created on `worker`'s thread
+            osaobj_rc: Reference counts of OSA objects, indexed by object ID
+            worker: The worker owning `script`
+        """
+        super().__init__(script, osaobj_rc)
+        self._worker = worker if worker is not None else _ScriptWorker()
+
+    @classmethod
+    def from_path(cls, path=DEFAULT_SCRIPT_PATH):
+        """Compile the script at `path` on a new worker thread."""
+        worker = _ScriptWorker()
+        script = worker.submit(OSAScript.from_path, path).result().script
+        return cls(script, worker=worker)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Run `func(*args, **kwargs)` on the worker thread and return a future for its result."""
+        return self._worker.submit(func, *args, **kwargs)
+
+    def _call_str(self, func_name: str, arg: str):
+        if threading.current_thread() is self._worker.thread:
+            return super()._call_str(func_name, arg)
+        return self._worker.submit(super()._call_str, func_name, arg).result()
+
+    def _call_str_nowait(self, func_name: str, arg: str):
+        # Jobs run in submission order, so calls made afterwards still run after this one
+        if threading.current_thread() is self._worker.thread:
+            super()._call_str(func_name, arg)
+        else:
+            self._worker.submit(super()._call_str, func_name, arg).add_done_callback(_log_failure)
+
+    def close(self):
+        """Stop the worker thread. The script can not be used afterwards."""
+        self.flush_pending_releases()
+        self._worker.close()
+
+
+class AsyncOSAObjProxy:
+    """Awaitable view of an OSA object proxy.
+
+    Attribute reads and method calls return awaitables that are resolved on the worker
+    thread of the proxy's `ThreadedHelperScript`, so the event loop is never blocked
+    on an Apple Event.
+
+    Examples:
+        >>> app = AsyncApplication('Finder')
+        >>> name, frontmost = await asyncio.gather(app.name, app.frontmost)
+    """
+
+    def __init__(self, proxy: OSAObjProxy):
+        """Wrap a proxy created by a `ThreadedHelperScript`.
+
+        Args:
+            proxy: The proxy to wrap
+        """
+        if not isinstance(proxy._helper_script, ThreadedHelperScript):
+            raise TypeError('Async access requires a proxy created by a ThreadedHelperScript, e.g. via AsyncApplication')
+        self._proxy = proxy
+
+    @property
+    def sync(self) -> OSAObjProxy:
+        """The wrapped synchronous proxy."""
+        return self._proxy
+
+    def _submit(self, func: Callable, *args, **kwargs) -> asyncio.Future:
+        future = self._proxy._helper_script.submit(func, *args, **kwargs)
+        return asyncio.wrap_future(future)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        attr = getattr(type(self._proxy), name, None)
+        if callable(attr):
+            def method(*args, **kwargs) -> asyncio.Future:
+                return self._submit(attr, self._proxy, *args, **kwargs)
+            return method
+        return self._submit(getattr, self._proxy, name)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__}: {self._proxy!r}>'
+
+
+class AsyncApplication(AsyncOSAObjProxy):
+    """Awaitable interface to a macOS application running on its own script thread."""
+
+    def __init__(self, name: str, helper_script: Optional[ThreadedHelperScript] = None):
+        """Initialize an AsyncApplication instance.
+
+        Args:
+            name: Name of the application to control
+            helper_script: Threaded helper script to use. A new one is created if not provided.
+        """
+        if helper_script is None:
+            helper_script = ThreadedHelperScript.from_path(DEFAULT_SCRIPT_PATH)
+        app: Any = helper_script.get_application(name)
+        super().__init__(app)
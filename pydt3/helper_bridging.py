@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import array
 import datetime
-import json
 import os
 import logging
+import threading
+import time
+import weakref
 
 from typing import Optional, TYPE_CHECKING
 from functools import lru_cache
 
-from .osascript import OSAScript
+from .osascript import OSAScript, json_dumps
 from .objproxy import OSAObjProxy, OSAObjArray, DefaultOSAObjProxy
 
 
@@ -19,7 +22,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Default script path for JXA helper functionality
+# Default script path for JXA helper functionality.
+# The script is compiled from jxa_helper_v2.js ahead of time and loaded once, into `HelperScript.default`.
 DEFAULT_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), 'jxa_helper.scpt')
 
 
@@ -33,18 +37,51 @@ class HelperScript(OSAScript):
     # Class maps for object type resolution
     _class_map = {} # type: dict[str, dict[str, type[OSAObjProxy]]]
     _default_app_class_map = {}
+    # Bumped whenever a class map changes, so cached application references are re-resolved
+    _class_map_version = 0
+
+    # Released objects are freed in the JXA runtime in batches. A batch is flushed once it
+    # holds this many ids, or when an id is released this many seconds after the batch started.
+    RELEASE_BATCH_SIZE = 128
+    RELEASE_BATCH_INTERVAL = 0.05
+    # Initial number of slots in the reference count array
+    INITIAL_RC_CAPACITY = 1024
 
     default: HelperScript
 
-    def __init__(self, script: NSAppleScript, osaobj_rc: Optional[dict] = None):
+    def __init__(self, script: NSAppleScript, osaobj_rc: Optional[array.array] = None):
         """Initialize the helper script.
         
         Args:
             script: The compiled AppleScript/JXA script
-            osaobj_rc: Reference counting dictionary for OSA objects
+            osaobj_rc: Reference counts of OSA objects, indexed by object ID
         """
         super().__init__(script)
-        self._osaobj_rc = {} if osaobj_rc is None else osaobj_rc
+        if osaobj_rc is None:
+            osaobj_rc = array.array('i', bytes(4 * self.INITIAL_RC_CAPACITY))
+        self._osaobj_rc = osaobj_rc
+        # Latest generation seen for each object ID, see `flush_pending_releases`
+        self._osaobj_gen = array.array('q', bytes(8 * len(osaobj_rc)))
+        # Ids of unreferenced objects waiting to be released in the JXA runtime
+        self._pending_release: set[int] = set()
+        self._pending_release_since = 0.0
+        # Reentrant, since a proxy's `__del__` can run while the lock is held
+        self._release_lock = threading.RLock()
+        # Live proxies by object ID, so that each OSA object has at most one proxy
+        self._proxy_cache: weakref.WeakValueDictionary[int, OSAObjProxy] = weakref.WeakValueDictionary()
+        # Application references and the class map version they were resolved with, by name
+        self._applications: dict[str, tuple[int, Application]] = {}
+
+    def _grow_reference_counts(self, obj_id: int):
+        """Grow the reference count array geometrically so that `obj_id` is a valid index.
+
+        The JXA helper hands out dense, increasing object IDs, so the array stays compact.
+        """
+        rc = self._osaobj_rc
+        new_size = max(obj_id + 1, 2 * len(rc))
+        rc.frombytes(bytes(rc.itemsize * (new_size - len(rc))))
+        generations = self._osaobj_gen
+        generations.frombytes(bytes(generations.itemsize * (new_size - len(generations))))
 
     def _unwrap_from_json(self, response: dict):
         """Convert JSON response from JXA to Python objects.
@@ -66,9 +103,14 @@ class HelperScript(OSAScript):
             app_name = response.get('app', None)
             obj_id = response['objId']
             reference_cls = self.determine_class(app_name, class_name)
-            logger.debug(f'determined reference_cls: {reference_cls}')
+            logger.debug('determined reference_cls: %s', reference_cls)
             assert issubclass(reference_cls, OSAObjProxy)
-            proxy = reference_cls(helper_script=self, obj_id=obj_id, class_name=class_name)
+            proxy = reference_cls.get_or_create(self, obj_id, class_name)
+            # Only record the generation once the proxy holds a reference. A release queued
+            # before that carries an older generation, which the JXA side ignores.
+            generation = response.get('gen')
+            if generation is not None and generation > self._osaobj_gen[obj_id]:
+                self._osaobj_gen[obj_id] = generation
             return proxy
 
         elif response['type'] == 'array':
@@ -134,15 +176,27 @@ class HelperScript(OSAScript):
             params: Parameters to pass to the function
         """
         params = self._wrap_to_json(params)
-        logger.debug(f'func_name: {func_name}')
-        params = json.dumps(params)
-        logger.debug(f'params: {params}')
-        result = self._call_str(func_name, params)
-        logger.debug(f'result: {result}')
-
-        result = json.loads(result)
+        # Lazy %-formatting, since bulk payloads are expensive to format when DEBUG is off
+        logger.debug('func_name: %s', func_name)
+        logger.debug('params: %s', params)
+        result = self._call_json(func_name, params)
+        logger.debug('result: %s', result)
         return self._unwrap_from_json(result)
 
+    def _call_str_nowait(self, func_name: str, arg: str):
+        """Call a function in the script without waiting for its result.
+
+        The script runs in-process, so the call has finished when this returns. Transports
+        that can pipeline calls override this; calls made afterwards still run after it.
+        """
+        self._call_str(func_name, arg)
+
+    def _call_func_pyobj_nowait(self, func_name: str, params):
+        """Call a JXA function with Python objects, without waiting for it to finish."""
+        params = json_dumps(self._wrap_to_json(params))
+        logger.debug('func_name: %s (no wait), params: %s', func_name, params)
+        self._call_str_nowait(func_name, params)
+
     # Core JXA interaction methods
 
     def echo(self, params):
@@ -153,9 +207,73 @@ class HelperScript(OSAScript):
         """Release an OSA object by its ID."""
         return self._call_func_pyobj_inout('releaseObjectWithId', {'id': id})
 
+    def release_objects_with_ids(self, ids: list[int], generations: Optional[list[int]] = None):
+        """Release several OSA objects by their IDs in a single call.
+
+        If `generations` is given, an object is only released if its ID has not been handed
+        out again since the corresponding generation.
+        """
+        return self._call_func_pyobj_inout('releaseObjectsWithIds', {'ids': ids, 'generations': generations})
+
+    def defer_release(self, id: int):
+        """Queue an OSA object for release, flushing the queue if the batch is full or old enough."""
+        with self._release_lock:
+            pending = self._pending_release
+            now = time.monotonic()
+            if not pending:
+                self._pending_release_since = now
+            pending.add(id)
+            flush = len(pending) >= self.RELEASE_BATCH_SIZE or now - self._pending_release_since >= self.RELEASE_BATCH_INTERVAL
+        if flush:
+            self.flush_pending_releases()
+
+    def rebind_object(self, old_id: int, new_id: int):
+        """Move one reference from `old_id` to `new_id`.
+
+        The old object is queued for release only if this was its last reference.
+        """
+        rc = self._osaobj_rc
+        if max(old_id, new_id) >= len(rc):
+            self._grow_reference_counts(max(old_id, new_id))
+        rc[new_id] += 1
+        self.cancel_release(new_id)
+        rc[old_id] -= 1
+        if rc[old_id] <= 0:
+            self.defer_release(old_id)
+
+    def cancel_release(self, id: int):
+        """Remove an OSA object from the release queue because it is referenced again."""
+        with self._release_lock:
+            self._pending_release.discard(id)
+
+    def flush_pending_releases(self):
+        """Release all queued OSA objects in the JXA runtime, without waiting for the release.
+
+        Each ID is sent with the latest generation seen for it. A call running concurrently,
+        or a response still being unwrapped, may hand the same ID out again before the release
+        runs; the JXA side then keeps the object, and the new proxy takes it over.
+        This is called from `__del__`, so it must never block on the call.
+        """
+        with self._release_lock:
+            if not self._pending_release:
+                return
+            ids = list(self._pending_release)
+            self._pending_release.clear()
+            generations = [self._osaobj_gen[id] for id in ids]
+        self._call_func_pyobj_nowait('releaseObjectsWithIds', {'ids': ids, 'generations': generations})
+
     def get_application(self, name: str) -> Application:
-        """Get a reference to a macOS application by name."""
-        return self._call_func_pyobj_inout('getApplication', {'name': name})
+        """Get a reference to a macOS application by name.
+
+        The reference is created once per script and reused by later calls, until a class
+        map is registered that may resolve the application to a different class.
+        """
+        cached = self._applications.get(name)
+        if cached is not None and cached[0] == HelperScript._class_map_version:
+            return cached[1]
+        app = self._call_func_pyobj_inout('getApplication', {'name': name})
+        self._applications[name] = (HelperScript._class_map_version, app)
+        return app
     
     def eval_jxa_code_snippet(self, source: str, locals: Optional[dict] = None):
         """Evaluate a JXA code snippet."""
@@ -169,9 +287,21 @@ class HelperScript(OSAScript):
         """Get a property value from an OSA object."""
         return self._call_func_pyobj_inout('getProperty', {'obj': obj, 'name': name})
 
-    def get_properties(self, obj: OSAObjProxy, properties: list):
-        """Get multiple property values from an OSA object."""
-        return self._call_func_pyobj_inout('getProperties', {'obj': obj, 'properties': properties})
+    def get_properties(self, obj: OSAObjProxy, properties: list, evaluate: bool = False):
+        """Get multiple property values from an OSA object in a single call.
+
+        If `evaluate` is True, each property is called (as `_call_method` does) instead of
+        being returned as a specifier.
+        """
+        return self._call_func_pyobj_inout('getProperties', {'obj': obj, 'properties': properties, 'evaluate': evaluate})
+
+    def get_all_items(self, obj: OSAObjArray, start: int = 0, stop: Optional[int] = None) -> list:
+        """Get the elements of an array proxy in the range [start, stop) in a single call."""
+        return self._call_func_pyobj_inout('getAllItems', {'obj': obj, 'start': start, 'stop': stop})
+
+    def query_objects(self, obj: OSAObjArray, fields: list, filter: Optional[dict] = None) -> list[dict]:
+        """Filter an array proxy and read `fields` of every matching element in a single call."""
+        return self._call_func_pyobj_inout('queryObjects', {'obj': obj, 'filter': filter, 'fields': fields})
 
     def set_properties(self, obj: OSAObjProxy, key_values: dict):
         """Set multiple property values on an OSA object."""
@@ -181,6 +311,10 @@ class HelperScript(OSAScript):
         """Call a method on an OSA object."""
         return self._call_func_pyobj_inout('callMethod', {'obj': obj, 'name': name, 'args': args, 'kwargs': kwargs})
 
+    def call_method_nowait(self, obj: OSAObjProxy, name: str, args = None, kwargs: dict = None):
+        """Call a method on an OSA object without waiting for it. The result is discarded."""
+        self._call_func_pyobj_nowait('callMethodNoResult', {'obj': obj, 'name': name, 'args': args, 'kwargs': kwargs})
+
     def call_self(self, obj: OSAObjProxy, args = None, kwargs: dict = None):
         """Call an OSA object as a function."""
         return self._call_func_pyobj_inout('callSelf', {'obj': obj, 'args': args, 'kwargs': kwargs})
@@ -220,18 +354,56 @@ class HelperScript(OSAScript):
     def register_class_map(cls, app_name: str, class_map: dict[str, type[OSAObjProxy]]):
         """Register class mappings for an application."""
         cls._class_map[app_name] = class_map
+        HelperScript._class_map_version += 1
+        cls.determine_class.cache_clear()
     
+    @classmethod
+    def register_sdef_class_map(cls, app_name: str, app_path: str):
+        """Register proxy classes generated from an application's scripting definition.
+
+        Every class of the application gets a `DefaultOSAObjProxy` subclass with real
+        properties, so attribute access does not go through `__getattr__`. Classes that
+        are already registered for the application take precedence.
+
+        Args:
+            app_name: Name of the application, as passed to `get_application`
+            app_path: Path to the application bundle, e.g. `/Applications/DEVONthink 3.app`
+        """
+        from .sdef import load_sdef, parse_sdef, make_proxy_classes
+
+        classes = parse_sdef(load_sdef(app_path))
+        generated = make_proxy_classes(classes, bases=cls._default_app_class_map)
+        cls._class_map[app_name] = {**generated, **cls._class_map.get(app_name, {})}
+        HelperScript._class_map_version += 1
+        # Classes resolved before the registration may now map to a generated class
+        cls.determine_class.cache_clear()
+
     @classmethod
     def set_default_class_map(cls, class_map: dict[str, type[OSAObjProxy]]):
         """Set the default class mappings."""
         cls._default_app_class_map = class_map
+        HelperScript._class_map_version += 1
+        cls.determine_class.cache_clear()
 
     def __hash__(self) -> int:
         return id(self)
 
 
+class _LazyDefaultScript:
+    """Loads `HelperScript.default` on first access.
+
+    This keeps importing pydt3 from loading the script and the PyObjC Foundation bindings.
+    The loaded script replaces the descriptor, so later accesses are plain attribute lookups.
+    """
+
+    def __get__(self, instance, owner) -> HelperScript:
+        script = HelperScript.from_path(DEFAULT_SCRIPT_PATH)
+        HelperScript.default = script
+        return script
+
+
 # Initialize default helper script
-HelperScript.default = HelperScript.from_path(DEFAULT_SCRIPT_PATH)
+HelperScript.default = _LazyDefaultScript()
 
 if __name__ == '__main__':
     script = HelperScript.from_path('/Users/koc/Developer/devonthink/python-api/pydt3/jxa_helper.scpt')
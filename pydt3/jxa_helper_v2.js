@@ -1,3 +1,9 @@
+/**
+ * JXA helper functions for bridging between Python and macOS applications.
+ * This is the source of jxa_helper.scpt, which is compiled ahead of time with
+ * `osacompile -l JavaScript -o jxa_helper.scpt jxa_helper_v2.js` and loaded once per process.
+ */
+
 /**
  * ObjectPoolManager handles the lifecycle of JXA objects in memory.
  * It maintains a mapping between object IDs and their instances to enable
@@ -8,6 +14,7 @@ class ObjectPoolManager {
         this._currentId = 0;  // Counter for generating unique object IDs
         this._objectIdMap = new Map();  // Maps objects to their IDs
         this._idObjectMap = new Map();  // Maps IDs to their objects
+        this._generations = new Map();  // Counts how often each ID has been handed out
     }
 
     /**
@@ -24,27 +31,47 @@ class ObjectPoolManager {
      }
 
     /**
-     * Gets or assigns a unique ID for an object
+     * Gets or assigns a unique ID for an object.
+     * New IDs are handed out densely in increasing order so that Python can index
+     * its reference counts by ID. Every hand-out bumps the ID's generation.
      * @param {Object} obj - The object to track
      * @returns {number} The object's unique identifier
      */
     getId(obj) {
-        if (!this._objectIdMap.has(obj)) {
+        let id = this._objectIdMap.get(obj);
+        if (id === undefined) {
             this._currentId += 1;
-            this._objectIdMap.set(obj, this._currentId);
-            this._idObjectMap.set(this._currentId, obj);
+            id = this._currentId;
+            this._objectIdMap.set(obj, id);
+            this._idObjectMap.set(id, obj);
         }
-        return this._currentId;
+        this._generations.set(id, (this._generations.get(id) || 0) + 1);
+        return id;
+    }
+
+    /**
+     * Gets the generation of an ID, i.e. how often it has been handed out
+     * @param {number} id - The object's unique identifier
+     * @returns {number} The generation of the ID
+     */
+    getGeneration(id) {
+        return this._generations.get(id);
     }
 
     /**
      * Removes an object from the pool by its ID
      * @param {number} objectId - ID of the object to release
+     * @param {number} [generation] - If given, the object is only released if its ID has not
+     *     been handed out again since this generation
      */
-    releaseObjectWithId(objectId) {
+    releaseObjectWithId(objectId, generation) {
+        if (generation !== undefined && generation !== this._generations.get(objectId)) {
+            return;
+        }
         const obj = this.getObject(objectId);
         this._idObjectMap.delete(objectId);
         this._objectIdMap.delete(obj);
+        this._generations.delete(objectId);
     }
 }
 
@@ -161,6 +188,16 @@ class JsonTranslator {
         this.objectPoolManager = objectPoolManager;
     }
 
+    /**
+     * Registers an object in the pool and returns the fields identifying it in a reference
+     * @param {Object} obj - The object to reference
+     * @returns {Object} The object's ID and the generation it was handed out with
+     */
+    referenceIds(obj) {
+        let objId = this.objectPoolManager.getId(obj);
+        return {objId, gen: this.objectPoolManager.getGeneration(objId)};
+    }
+
     /**
      * Converts a JXA object to a JSON representation
      * @param {*} obj - The object to convert
@@ -183,7 +220,7 @@ class JsonTranslator {
             if (guessClass === undefined) {
                 return {
                     type: 'reference',
-                    objId: this.objectPoolManager.getId(obj),
+                    ...this.referenceIds(obj),
                     app: Util.getAssociatedApplicationName(obj),
                     className: 'unknown'
                 }
@@ -226,7 +263,7 @@ class JsonTranslator {
             if (guessClass === 'application') {
                 return {
                     type: 'reference',
-                    objId: this.objectPoolManager.getId(obj),
+                    ...this.referenceIds(obj),
                     app: Util.getAssociatedApplicationName(obj),
                     className: 'application'
                 }
@@ -235,7 +272,7 @@ class JsonTranslator {
             if (guessClass.startsWith('array::')) {
                 return {
                     type: 'reference',
-                    objId: this.objectPoolManager.getId(obj),
+                    ...this.referenceIds(obj),
                     app: Util.getAssociatedApplicationName(obj),
                     className: guessClass
                 }
@@ -243,7 +280,7 @@ class JsonTranslator {
 
             return {
                 type: 'reference',
-                objId: this.objectPoolManager.getId(obj),
+                ...this.referenceIds(obj),
                 className: guessClass,
                 app: Util.getAssociatedApplicationName(obj),
             }
@@ -283,7 +320,7 @@ class JsonTranslator {
         if (typeof obj === 'function') {
             return {
                 type: 'reference',
-                objId: this.objectPoolManager.getId(obj),
+                ...this.referenceIds(obj),
                 className: 'function'
             }
         }
@@ -362,6 +399,16 @@ function _releaseObjectWithId({id}) {
 }
 releaseObjectWithId = jsonTranslator.strIOFuncWrapper(_releaseObjectWithId);
 
+/**
+ * Releases several objects from the pool in a single call
+ * @param {Object} param0 - Object containing the IDs to release, and optionally the generation
+ *     each ID had when it was queued for release. IDs handed out again since then are kept.
+ */
+function _releaseObjectsWithIds({ids, generations}) {
+    ids.forEach((id, i) => objectPoolManager.releaseObjectWithId(id, generations ? generations[i] : undefined));
+}
+releaseObjectsWithIds = jsonTranslator.strIOFuncWrapper(_releaseObjectsWithIds);
+
 /**
  * Creates a new application instance
  * @param {Object} param0 - Object containing the application name
@@ -417,19 +464,61 @@ function _getProperty({obj, name}) {
 getProperty = jsonTranslator.strIOFuncWrapper(_getProperty);
 
 /**
- * Gets multiple property values from an object
- * @param {Object} param0 - Object containing target and property names
+ * Gets multiple property values from an object in a single call
+ * @param {Object} param0 - Object containing target, property names and whether to evaluate them
  * @returns {Object} Object containing the property values
  */
-function _getProperties({obj, properties}) {
+function _getProperties({obj, properties, evaluate}) {
     let result = {};
     for (let k of properties) {
-        result[k] = _getProperty({obj, name: k});
+        if (evaluate) {
+            result[k] = _callMethod({obj, name: k});
+        } else {
+            result[k] = _getProperty({obj, name: k});
+        }
     }
     return result;
 }
 getProperties = jsonTranslator.strIOFuncWrapper(_getProperties);
 
+/**
+ * Gets the elements of an array specifier in a single call
+ * @param {Object} param0 - Object containing the array specifier and the range to fetch
+ * @returns {Array} The elements in the range
+ */
+function _getAllItems({obj, start, stop}) {
+    let items = obj();
+    if (stop === null || stop === undefined) {
+        stop = items.length;
+    }
+    return items.slice(start, stop);
+}
+getAllItems = jsonTranslator.strIOFuncWrapper(_getAllItems);
+
+/**
+ * Filters an array specifier and reads the given properties of every matching element.
+ * Each property is read for all elements at once, so the cost does not grow with the
+ * number of elements.
+ * @param {Object} param0 - Object containing the array specifier, an optional `whose` filter and the property names
+ * @returns {Array} One object per element, mapping property names to values
+ */
+function _queryObjects({obj, filter, fields}) {
+    let specifier = (filter === null || filter === undefined) ? obj : obj.whose(filter);
+    let columns = fields.map((field) => specifier[field]());
+    // Counted separately, so that an empty `fields` still yields one row per element
+    let count = columns.length > 0 ? columns[0].length : specifier.length;
+    let rows = [];
+    for (let i = 0; i < count; i++) {
+        let row = {};
+        fields.forEach((field, j) => {
+            row[field] = columns[j][i];
+        });
+        rows.push(row);
+    }
+    return rows;
+}
+queryObjects = jsonTranslator.strIOFuncWrapper(_queryObjects);
+
 /**
  * Sets multiple property values on an object
  * @param {Object} param0 - Object containing target and key-value pairs
@@ -466,6 +555,16 @@ function _callMethod({obj, name, args, kwargs}) {
 }
 callMethod = jsonTranslator.strIOFuncWrapper(_callMethod);
 
+/**
+ * Calls a method on an object and discards the result, so that nothing is added to
+ * the object pool for a caller that never reads it
+ * @param {Object} param0 - Object containing target, method name, and arguments
+ */
+function _callMethodNoResult(params) {
+    _callMethod(params);
+}
+callMethodNoResult = jsonTranslator.strIOFuncWrapper(_callMethodNoResult);
+
 /**
  * Calls an object as a function
  * @param {Object} param0 - Object containing target and arguments
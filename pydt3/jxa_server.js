@@ -0,0 +1,87 @@
+/**
+ * Persistent server for the JXA helper functions.
+ *
+ * Run with `osascript -l JavaScript jxa_server.js /path/to/jxa_helper_v2.js`.
+ * The helper source is evaluated once, then requests are read from stdin as one JSON
+ * object per line: {"id": <number>, "func": <helper function name>, "arg": <JSON string>}.
+ * Each request is answered on stdout, in order, with {"id": ..., "result": <JSON string>}
+ * or {"id": ..., "error": <message>}.
+ */
+ObjC.import('Foundation');
+
+const globalObject = this;
+
+/**
+ * Reads newline-delimited text from a file handle
+ */
+class LineReader {
+    /**
+     * @param {Object} fileHandle - The NSFileHandle to read from
+     */
+    constructor(fileHandle) {
+        this.fileHandle = fileHandle;
+        this.buffer = '';
+    }
+
+    /**
+     * Reads the next line, blocking until it is available
+     * @returns {string|null} The line without its newline, or null at end of input
+     */
+    readLine() {
+        let index = this.buffer.indexOf('\n');
+        while (index === -1) {
+            let data = this.fileHandle.availableData;
+            if (data.length === 0) {
+                return null;
+            }
+            // Requests are ASCII, so a chunk never splits a character
+            this.buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+            index = this.buffer.indexOf('\n');
+        }
+        let line = this.buffer.slice(0, index);
+        this.buffer = this.buffer.slice(index + 1);
+        return line;
+    }
+}
+
+/**
+ * Writes a line to a file handle
+ * @param {Object} fileHandle - The NSFileHandle to write to
+ * @param {string} line - The line to write, without its newline
+ */
+function writeLine(fileHandle, line) {
+    fileHandle.writeData($(line + '\n').dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+/**
+ * Handles a single request
+ * @param {Object} request - The parsed request
+ * @returns {Object} The response
+ */
+function handleRequest({id, func, arg}) {
+    try {
+        let handler = globalObject[func];
+        if (typeof handler !== 'function') {
+            throw new Error(`Unknown helper function: ${func}`);
+        }
+        return {id, result: handler(arg)};
+    } catch (error) {
+        return {id, error: String(error)};
+    }
+}
+
+function run(argv) {
+    let source = $.NSString.stringWithContentsOfFileEncodingError(argv[0], $.NSUTF8StringEncoding, null).js;
+    // Indirect eval so that the helper functions are defined globally
+    (0, eval)(source);
+
+    let reader = new LineReader($.NSFileHandle.fileHandleWithStandardInput);
+    let stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+    let line = reader.readLine();
+    while (line !== null) {
+        if (line.length > 0) {
+            writeLine(stdout, JSON.stringify(handleRequest(JSON.parse(line))));
+        }
+        line = reader.readLine();
+    }
+}
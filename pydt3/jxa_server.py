@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import array
+import itertools
+import json
+import logging
+import os
+import subprocess
+import threading
+
+from typing import Optional
+
+from .helper_bridging import HelperScript
+from .osascript import json_loads
+
+
+logger = logging.getLogger(__name__)
+
+SERVER_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), 'jxa_server.js')
+HELPER_SOURCE_PATH = os.path.join(os.path.dirname(__file__), 'jxa_helper_v2.js')
+
+
+class JXAServerScript(HelperScript):
+    """Helper script served by a long-lived `osascript` subprocess.
+
+    Calls are written to the subprocess's stdin as JSON lines and answered on its stdout,
+    so no Apple Event is built per call and the JXA object pool lives as long as the
+    server. Every request gets a monotonic id and responses are matched by it.
+    The instance can be used from any thread.
+
+    A reader thread consumes the server's stdout for as long as the server runs, so the
+    server never blocks on a full pipe and calls made with `_call_str_nowait` can be
+    pipelined. Their responses are dropped when they arrive.
+
+    Examples:
+        >>> HelperScript.default = JXAServerScript.start()
+        >>> dt3 = DEVONthink3()
+    """
+
+    def __init__(self, process: subprocess.Popen, osaobj_rc: Optional[array.array] = None):
+        """Initialize with a running server process.
+
+        Args:
+            process: The `osascript` process running `jxa_server.js`
+            osaobj_rc: Reference counts of OSA objects, indexed by object ID
+        """
+        super().__init__(None, osaobj_rc)
+        self._process = process
+        self._request_ids = itertools.count(1)
+        # Responses by request id, until `_receive` picks them up
+        self._responses: dict[int, dict] = {}
+        # Ids of requests made with `_call_str_nowait`, whose responses are dropped
+        self._discarded: set[int] = set()
+        self._server_exited = False
+        # Guards the three fields above. Reentrant, like the write lock.
+        self._responses_changed = threading.Condition(threading.RLock())
+        # Reentrant, since a proxy's `__del__` can send a release while the lock is held
+        self._write_lock = threading.RLock()
+        self._reader = threading.Thread(target=self._read_responses, name='pydt3-jxa-server-reader', daemon=True)
+        self._reader.start()
+
+    @classmethod
+    def start(cls, server_path: str = SERVER_SCRIPT_PATH, helper_path: str = HELPER_SOURCE_PATH) -> JXAServerScript:
+        """Start a server process and return a helper script talking to it.
+
+        Args:
+            server_path: Path to the server script
+            helper_path: Path to the JXA helper source evaluated by the server
+        """
+        process = subprocess.Popen(
+            ['osascript', '-l', 'JavaScript', server_path, helper_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        return cls(process)
+
+    def _send(self, func_name: str, arg: str, discard_response: bool = False) -> int:
+        """Write a request to the server without waiting for its response.
+
+        Args:
+            func_name: Name of the helper function to call
+            arg: The JSON argument of the call
+            discard_response: Whether the response is dropped when it arrives instead of
+                being kept for `_receive`
+
+        Returns:
+            int: The request id to pass to `_receive`
+        """
+        request_id = next(self._request_ids)
+        # Keep the request ASCII so the server can decode it in arbitrary chunks
+        line = json.dumps({'id': request_id, 'func': func_name, 'arg': arg}, ensure_ascii=True).encode('ascii') + b'\n'
+        if discard_response:
+            # Registered before the request is written, so the response can not arrive first
+            with self._responses_changed:
+                self._discarded.add(request_id)
+        with self._write_lock:
+            self._process.stdin.write(line)
+            self._process.stdin.flush()
+        return request_id
+
+    def _receive(self, request_id: int, timeout: Optional[float] = None) -> str:
+        """Wait for the response to a request.
+
+        Raises:
+            RuntimeError: If the call failed in the server or the server exited
+            TimeoutError: If no response arrived within `timeout` seconds
+        """
+        with self._responses_changed:
+            if not self._responses_changed.wait_for(
+                    lambda: request_id in self._responses or self._server_exited, timeout):
+                raise TimeoutError('Timed out waiting for the JXA server')
+            response = self._responses.pop(request_id, None)
+        if response is None:
+            raise RuntimeError(f'The JXA server exited with code {self._process.poll()}')
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['result']
+
+    def _read_responses(self):
+        """Read responses until the server exits. Runs on the reader thread.
+
+        Errors of dropped responses are logged since there is no caller left to raise them to.
+        """
+        for line in self._process.stdout:
+            if not line.strip():
+                continue
+            response = json_loads(line)
+            request_id = response['id']
+            with self._responses_changed:
+                discarded = request_id in self._discarded
+                if discarded:
+                    self._discarded.discard(request_id)
+                else:
+                    self._responses[request_id] = response
+                    self._responses_changed.notify_all()
+            if discarded and 'error' in response:
+                logger.warning(f'Call without waiting failed: {response["error"]}')
+        with self._responses_changed:
+            self._server_exited = True
+            self._responses_changed.notify_all()
+
+    def _call_str(self, func_name: str, arg: str):
+        return self._receive(self._send(func_name, arg))
+
+    def _call_str_nowait(self, func_name: str, arg: str):
+        # The server handles requests in order, so calls made afterwards still run after this one
+        self._send(func_name, arg, discard_response=True)
+
+    def close(self):
+        """Stop the server process. The script can not be used afterwards."""
+        self.flush_pending_releases()
+        self._process.stdin.close()
+        # The reader thread consumes the remaining responses and ends when the server exits
+        self._reader.join()
+        self._process.wait()
+
+    def __eq__(self, o: object) -> bool:
+        return self is o
+
+    def __hash__(self) -> int:
+        return id(self)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import logging
 
-from typing import Any, Optional, TypeVar, Sequence, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Any, Iterable, Optional, TypeVar, Sequence, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
     from .helper_bridging import HelperScript
+    from .async_proxy import AsyncOSAObjProxy
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +17,14 @@ class OSAObjProxy:
     
     This class provides the foundation for interacting with Apple Script/JXA objects
     from Python, handling reference counting and basic object operations.
+
+    Proxies are created in large numbers when iterating arrays, so they use `__slots__`
+    instead of a per-instance `__dict__`. Subclasses that only add properties and
+    methods should declare empty `__slots__` as well.
     """
+
+    __slots__ = ('_helper_script', 'obj_id', 'class_name', '_prefetch_cache', '_prefetch_call_cache',
+                 '_prop_cache', '_bind_version', '__weakref__')
     
     def __init__(self, helper_script: Optional[HelperScript] = None, obj_id: Optional[int] = None, class_name: Optional[str] = None):
         """Initialize an OSA object proxy.
@@ -25,6 +34,14 @@ class OSAObjProxy:
             obj_id: Unique identifier for the OSA object
             class_name: Name of the OSA object's class
         """
+        # Values fetched ahead of time by `prefetch`, keyed by property name.
+        # Most proxies never use these caches, so they are only created on first use.
+        self._prefetch_cache: Optional[dict[str, Any]] = None
+        self._prefetch_call_cache: Optional[dict[str, Any]] = None
+        # Values of properties listed in `_IMMUTABLE_PROPS`, valid until the next `bind`
+        self._prop_cache: Optional[dict[str, Any]] = None
+        # Bumped on every `bind` so that memoized getters keyed on it are invalidated
+        self._bind_version: int = 0
         self._helper_script: Optional[HelperScript] = helper_script
         self.obj_id: Optional[int] = obj_id
         self.class_name: Optional[str] = class_name
@@ -38,24 +55,35 @@ class OSAObjProxy:
         Used to track when the object can be safely released in the JXA runtime.
         """
         obj_id = self.obj_id
-        if self.obj_id is None:
+        if obj_id is None:
             raise ValueError('obj_id is None')
-        self._helper_script._osaobj_rc.setdefault(obj_id, 0)
-        self._helper_script._osaobj_rc[obj_id] += 1
+        helper_script = self._helper_script
+        if obj_id >= len(helper_script._osaobj_rc):
+            helper_script._grow_reference_counts(obj_id)
+        helper_script._osaobj_rc[obj_id] += 1
+        # Checked without the lock first, since the object is rarely queued for release
+        if obj_id in helper_script._pending_release:
+            helper_script.cancel_release(obj_id)
     
     def _decrease_reference_count(self):
         """Decrement the reference count for this object.
         
-        When count reaches 0, the object is released from the JXA runtime.
+        When count reaches 0, the object is queued for release from the JXA runtime.
+        Releases are sent in batches, see `HelperScript.defer_release`.
         """
         obj_id = self.obj_id
-        if self.obj_id is None:
+        if obj_id is None:
             raise ValueError('obj_id is None')
-        self._helper_script._osaobj_rc.setdefault(obj_id, 0)
-        self._helper_script._osaobj_rc[obj_id] -= 1
-        logger.debug(f'decrease reference count for {obj_id}, current count: {self._helper_script._osaobj_rc[obj_id]}')
-        if self._helper_script._osaobj_rc[obj_id] <= 0:
-            self._helper_script.release_object_with_id(obj_id)
+        helper_script = self._helper_script
+        rc = helper_script._osaobj_rc
+        if obj_id >= len(rc):
+            helper_script._grow_reference_counts(obj_id)
+        rc[obj_id] -= 1
+        count = rc[obj_id]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'decrease reference count for {obj_id}, current count: {count}')
+        if count <= 0:
+            helper_script.defer_release(obj_id)
     
     def bind(self, script: HelperScript, obj_id: int, class_name: str):
         """Bind this proxy to a different OSA object.
@@ -65,13 +93,42 @@ class OSAObjProxy:
             obj_id: New object ID to bind to
             class_name: New class name
         """
-        if self.obj_id is not None:
-            self._decrease_reference_count()
+        old_script, old_id = self._helper_script, self.obj_id
+        self._prefetch_cache = self._prefetch_call_cache = self._prop_cache = None
+        self._bind_version += 1
+        if old_script is not None and old_script._proxy_cache.get(old_id) is self:
+            del old_script._proxy_cache[old_id]
         self._helper_script = script
         self.obj_id = obj_id
         self.class_name = class_name
-        # Increment reference count for new binding
+        if old_id is not None and old_script is script:
+            # Move the reference in one step, so rebinding to the same object never releases it
+            script.rebind_object(old_id, obj_id)
+            return
+        # Increment reference count for new binding before releasing the old one
         self._increase_reference_count()
+        if old_id is not None:
+            old_script._osaobj_rc[old_id] -= 1
+            if old_script._osaobj_rc[old_id] <= 0:
+                old_script.defer_release(old_id)
+
+    @classmethod
+    def get_or_create(cls, helper_script: HelperScript, obj_id: int, class_name: Optional[str] = None):
+        """Get the live proxy of this class for an OSA object, or create one.
+
+        Proxies are interned per helper script by object ID, so repeated references to
+        the same OSA object share one proxy (and its caches).
+
+        Args:
+            helper_script: Script handler for JXA communication
+            obj_id: Unique identifier for the OSA object
+            class_name: Name of the OSA object's class
+        """
+        proxy = helper_script._proxy_cache.get(obj_id)
+        if type(proxy) is not cls:
+            proxy = cls(helper_script=helper_script, obj_id=obj_id, class_name=class_name)
+            helper_script._proxy_cache[obj_id] = proxy
+        return proxy
 
     @classmethod
     def from_proxy(cls, proxy: OSAObjProxy):
@@ -80,20 +137,89 @@ class OSAObjProxy:
         Args:
             proxy: Existing proxy object to copy from
         """
-        return cls(proxy._helper_script, proxy.obj_id, proxy.class_name)
+        return cls.get_or_create(proxy._helper_script, proxy.obj_id, proxy.class_name)
+
+    @property
+    def a(self) -> AsyncOSAObjProxy:
+        """Awaitable view of this proxy.
+
+        Only available for proxies created by a `ThreadedHelperScript`.
+
+        Examples:
+            >>> await asyncio.gather(app.a.id, app.a.name, app.a.frontmost)
+        """
+        from .async_proxy import AsyncOSAObjProxy
+        return AsyncOSAObjProxy(self)
+
+    def prefetch(self, names: Iterable[str], evaluate: bool = False) -> dict[str, Any]:
+        """Fetch several properties with a single JXA call and cache the results.
+
+        Subsequent `_get_property` calls (or argument-less `_call_method` calls if
+        `evaluate` is True) for these names are served from the cache instead of
+        issuing one Apple Event each.
+
+        Args:
+            names: Names of the properties to fetch
+            evaluate: Whether to call the properties (as `_call_method` does) rather than
+                fetch them as specifiers
+
+        Returns:
+            dict: The fetched values keyed by property name
+        """
+        values = self._helper_script.get_properties(self, list(names), evaluate)
+        if evaluate:
+            if self._prefetch_call_cache is None:
+                self._prefetch_call_cache = {}
+            self._prefetch_call_cache.update(values)
+        else:
+            if self._prefetch_cache is None:
+                self._prefetch_cache = {}
+            self._prefetch_cache.update(values)
+        return values
+
+    @contextmanager
+    def batch(self, names: Iterable[str], evaluate: bool = False):
+        """Context manager that prefetches `names` and drops the cached values on exit.
+
+        Examples:
+            >>> with record.batch(['name', 'uuid', 'path'], evaluate=True):
+            ...     print(record.name, record.uuid, record.path)
+        """
+        self.prefetch(names, evaluate)
+        try:
+            yield self
+        finally:
+            self._prefetch_cache = self._prefetch_call_cache = None
 
     def _set_property(self, name: str, value):
         """Set a property value on the OSA object."""
+        for cache in (self._prefetch_cache, self._prefetch_call_cache, self._prop_cache):
+            if cache is not None:
+                cache.pop(name, None)
         return self._helper_script.set_properties(self, {name: value})
 
     def _get_property(self, name: str):
         """Get a property value from the OSA object."""
+        cache = self._prefetch_cache
+        if cache is not None and name in cache:
+            return cache[name]
         return self._helper_script.get_property(self, name)
     
     def _call_method(self, name: str, args = None, kwargs: dict = None):
         """Call a method on the OSA object."""
+        cache = self._prefetch_call_cache
+        if args is None and kwargs is None and cache is not None and name in cache:
+            return cache[name]
         return self._helper_script.call_method(self, name, args, kwargs)
 
+    def _call_method_async(self, name: str, args = None, kwargs: dict = None):
+        """Call a method on the OSA object without waiting for it to finish.
+
+        For side-effect-only methods whose result is never read. The result is discarded,
+        and calls made afterwards still run after this one.
+        """
+        self._helper_script.call_method_nowait(self, name, args, kwargs)
+
     def __del__(self):
         """Clean up by decrementing reference count when object is deleted."""
         if self.obj_id is not None:
@@ -112,6 +238,8 @@ class OSAObjArray(OSAObjProxy, Sequence[T]):
     The type parameter T represents the type of elements in the array.
     """
 
+    __slots__ = ()
+
     def whose(self, filter) -> 'OSAObjArray[T]':
         """Apply a filter condition to the array.
         
@@ -121,30 +249,89 @@ class OSAObjArray(OSAObjProxy, Sequence[T]):
             New array containing only elements matching the filter
         """
         return self._call_method('whose', [filter])
+
+    def select(self, fields: Iterable[str], where: Optional[dict] = None) -> list[dict[str, Any]]:
+        """Read properties of the elements, optionally filtered, with a single JXA call.
+
+        Both the filter and the property reads run in JXA, and each property is read for
+        all elements at once. No proxies are created for the elements themselves, which
+        makes this much faster than iterating the array and reading each property of each
+        element. Fields whose values are objects, e.g. `parents`, still return proxies.
+
+        Args:
+            fields: JXA names of the properties to read, e.g. `['name', 'modificationDate']`.
+                If empty, one empty dict is returned per element.
+            where: Optional JXA filter condition, as accepted by `whose`
+
+        Returns:
+            One dict per element, mapping property names to values
+
+        Examples:
+            >>> database.records.select(['name', 'uuid'], where={'type': 'markdown'})
+        """
+        return self._helper_script.query_objects(self, list(fields), where)
     
     def __len__(self) -> int:
-        """Get the length of the array."""
+        """Get the length of the array.
+
+        The array is a live container, so the length is fetched on every call unless it
+        was prefetched, e.g. inside `batch(['length'])`.
+        """
         return self._get_property('length')
 
-    def __getitem__(self, index: int) -> T:
-        """Get an item from the array by index."""
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """Get an item from the array by index, or a list of items by slice.
+
+        Slices are fetched with a single JXA call.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step > 0:
+                return self._helper_script.get_all_items(self, start, stop)[::step]
+            # Fetch the range in natural order and reverse it locally
+            if start <= stop:
+                return []
+            items = self._helper_script.get_all_items(self, stop + 1, start + 1)
+            return items[::-1][::-step]
         return self._call_method('at', args=[index])
 
     def __iter__(self):
-        """Iterate over the array elements."""
-        for i in range(len(self)):
-            yield self[i]
+        """Iterate over the array elements.
+
+        All elements are fetched with a single JXA call instead of one call per element.
+        """
+        yield from self._helper_script.get_all_items(self)
 
 class DefaultOSAObjProxy(OSAObjProxy):
     """Default proxy implementation providing dictionary-like access.
     
     This class adds Python's mapping interface to access properties and
     methods of the OSA object using dictionary syntax.
+
+    Properties listed in `_IMMUTABLE_PROPS` are fetched once and then served from
+    the proxy's `_prop_cache`. Subclasses can extend the set with their own stable properties.
     """
+
+    __slots__ = ()
+
+    _IMMUTABLE_PROPS = frozenset({'id', 'name', 'class'})
+
+    def _get_stable_property(self, name: str):
+        """Get a property value, caching it if the property is known to be immutable."""
+        if name not in self._IMMUTABLE_PROPS:
+            return self._get_property(name)
+        cache = self._prop_cache
+        if cache is None:
+            cache = self._prop_cache = {}
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = self._get_property(name)
+            return value
     
     def __getitem__(self, key: str):
         """Get a property value using dictionary syntax."""
-        return self._get_property(key)
+        return self._get_stable_property(key)
     
     def __setitem__(self, key: str, value):
         """Set a property value using dictionary syntax."""
@@ -152,4 +339,7 @@ class DefaultOSAObjProxy(OSAObjProxy):
     
     def __getattr__(self, name: str):
         """Get a property value using attribute syntax."""
-        return self._get_property(name)
+        if name.startswith('_'):
+            # Unset slots and dunder lookups are not OSA properties
+            raise AttributeError(name)
+        return self._get_stable_property(name)
@@ -2,12 +2,59 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from logging import getLogger
-from Foundation import NSAppleScript, NSURL, NSAppleEventDescriptor
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 logger = getLogger(__name__)
 
+# Four-character codes used to invoke a subroutine of a script, computed once at import
+ASCR = int.from_bytes(b'ascr', 'big')
+PSBR = int.from_bytes(b'psbr', 'big')
+KEYWORD_ARGS = int.from_bytes(b'----', 'big')
+KEYWORD_NAME = int.from_bytes(b'snam', 'big')
+TYPE_UTF8 = int.from_bytes(b'utf8', 'big')
+
+if orjson is not None:
+    def json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        # Like json.dumps, serialize non-str dict keys instead of raising
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# PyObjC Foundation bindings, imported by `_lazy_import` on first use
+NSAppleScript = NSURL = NSAppleEventDescriptor = None
+_NULL_DESCRIPTOR = None
+
+
+def _lazy_import():
+    """Import the PyObjC Foundation bindings on first use.
+
+    Loading Foundation initializes a large part of the PyObjC bridge, so it is deferred
+    until a script is actually created rather than done when pydt3 is imported.
+    """
+    global NSAppleScript, NSURL, NSAppleEventDescriptor, _NULL_DESCRIPTOR
+    if NSAppleScript is not None:
+        return
+    from Foundation import NSAppleScript, NSURL, NSAppleEventDescriptor
+    _NULL_DESCRIPTOR = NSAppleEventDescriptor.nullDescriptor()
+
+
+@lru_cache(maxsize=256)
+def _string_descriptor(value: str):
+    """Create a string descriptor, reusing it for repeated values such as function names."""
+    return NSAppleEventDescriptor.descriptorWithString_(value)
+
 
 class OSAScript:
     """Base class for executing AppleScript/JXA scripts via macOS's Open Scripting Architecture.
@@ -16,12 +63,16 @@ class OSAScript:
     using macOS's native scripting infrastructure through PyObjC bindings.
     """
 
+    # Subroutine call event without parameters, copied for every call
+    _event_template = None
+
     def __init__(self, script: NSAppleScript):
         """Initialize with a compiled AppleScript.
         
         Args:
             script: Compiled NSAppleScript instance
         """
+        _lazy_import()
         self.script = script
 
     @classmethod
@@ -37,6 +88,7 @@ class OSAScript:
         Raises:
             RuntimeError: If script compilation fails
         """
+        _lazy_import()
         url = NSURL.fileURLWithPath_(path)
         script, error = NSAppleScript.alloc().initWithContentsOfURL_error_(url, None)
         if error:
@@ -61,19 +113,17 @@ class OSAScript:
         """
         script = self.script
         # Create the Apple Event for script execution
-        event = NSAppleEventDescriptor.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
-            self.fourcharcode(b'ascr'), self.fourcharcode(b'psbr'), 
-            NSAppleEventDescriptor.nullDescriptor(), 0, 0)
+        event = self._new_event()
         
         # Set up the function arguments
         descriptor_list = NSAppleEventDescriptor.listDescriptor()
-        descriptor_list.insertDescriptor_atIndex_(NSAppleEventDescriptor.descriptorWithString_(arg), 0)
-        event.setDescriptor_forKeyword_(descriptor_list, self.fourcharcode(b'----'))
+        # Pass the argument as UTF-8 text to skip the conversion to UTF-16
+        arg_descriptor = NSAppleEventDescriptor.descriptorWithDescriptorType_data_(TYPE_UTF8, arg.encode('utf-8'))
+        descriptor_list.insertDescriptor_atIndex_(arg_descriptor, 0)
+        event.setDescriptor_forKeyword_(descriptor_list, KEYWORD_ARGS)
 
         # Set the function name
-        event.setDescriptor_forKeyword_(
-            NSAppleEventDescriptor.descriptorWithString_(func_name), 
-            self.fourcharcode(b'snam'))
+        event.setDescriptor_forKeyword_(_string_descriptor(func_name), KEYWORD_NAME)
 
         # Execute the event and handle any errors
         result, error = script.executeAppleEvent_error_(event, None)
@@ -82,11 +132,37 @@ class OSAScript:
         else:
             return result.stringValue()
 
+    def _call_json(self, func_name: str, payload: Any) -> Any:
+        """Call a function in the script with a JSON payload and decode its JSON result.
+
+        The whole payload is serialized into the single string argument of the call, so
+        its size does not change the number of descriptors built. The script side parses
+        it with `JSON.parse`. Uses `orjson` when it is installed.
+
+        Args:
+            func_name: Name of the function to call
+            payload: JSON-serializable argument to pass to the function
+
+        Returns:
+            The decoded result
+        """
+        return json_loads(self._call_str(func_name, json_dumps(payload)))
+
+    @classmethod
+    def _new_event(cls):
+        """Return a fresh subroutine call event, copied from a cached template."""
+        template = OSAScript._event_template
+        if template is None:
+            template = OSAScript._event_template = NSAppleEventDescriptor.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+                ASCR, PSBR, _NULL_DESCRIPTOR, 0, 0)
+        return template.copy()
+
     def fourcharcode(self, chars: bytes):
         """Convert a 4-character code to its integer representation.
         
         Apple Events use 4-character codes as identifiers. This method converts
-        a 4-byte string to its corresponding integer value.
+        a 4-byte string to its corresponding integer value. The codes used internally
+        are precomputed as module constants, e.g. `ASCR`.
         
         Args:
             chars: 4-byte string to convert
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+import xml.etree.ElementTree as ET
+
+from typing import Optional
+
+from .objproxy import OSAObjProxy, DefaultOSAObjProxy
+
+
+logger = logging.getLogger(__name__)
+
+
+def jxa_name(sdef_name: str) -> str:
+    """Convert an AppleScript term to its JXA name, e.g. `plain text` -> `plainText`, `MIME type` -> `mimeType`.
+
+    Like JXA, the whole first word is lowercased, so acronyms become `url` and `id`.
+    """
+    first, *rest = sdef_name.split()
+    return first.lower() + ''.join(word[:1].upper() + word[1:] for word in rest)
+
+
+def load_sdef(app_path: str) -> str:
+    """Get the scripting definition of an application with the `sdef` tool.
+
+    Args:
+        app_path: Path to the application bundle, e.g. `/Applications/DEVONthink 3.app`
+
+    Returns:
+        str: The sdef XML
+    """
+    return subprocess.run(['sdef', app_path], check=True, capture_output=True, text=True).stdout
+
+
+def parse_sdef(sdef_xml: str) -> dict[str, list[str]]:
+    """Collect the JXA property and element names of every class in a scripting definition.
+
+    Inherited properties and class extensions are merged into each class.
+
+    Args:
+        sdef_xml: The sdef XML, as returned by `load_sdef`
+
+    Returns:
+        dict: JXA property and element names keyed by JXA class name
+    """
+    root = ET.fromstring(sdef_xml)
+    plurals: dict[str, str] = {}
+    own: dict[str, list[tuple[str, str]]] = {}
+    parents: dict[str, str] = {}
+
+    for node in root.iter():
+        if node.tag not in ('class', 'class-extension'):
+            continue
+        name = node.get('name') if node.tag == 'class' else node.get('extends')
+        if name is None:
+            continue
+        if node.tag == 'class':
+            plurals[name] = node.get('plural', name + 's')
+            if node.get('inherits'):
+                parents[name] = node.get('inherits')
+        members_of_class = own.setdefault(name, [])
+        members_of_class.extend(('property', prop.get('name')) for prop in node.findall('property') if prop.get('name'))
+        members_of_class.extend(('element', element.get('type')) for element in node.findall('element') if element.get('type'))
+
+    def members(name: str, seen: frozenset = frozenset()) -> list[tuple[str, str]]:
+        result = []
+        parent = parents.get(name)
+        if parent is not None and parent not in seen:
+            result.extend(members(parent, seen | {name}))
+        result.extend(own.get(name, []))
+        return result
+
+    classes = {}
+    for name in own:
+        properties = []
+        for kind, member in members(name):
+            # Elements are accessed by the plural of their class name
+            if kind == 'element':
+                member = plurals.get(member, member + 's')
+            member = jxa_name(member)
+            if member not in properties:
+                properties.append(member)
+        classes[jxa_name(name)] = properties
+    return classes
+
+
+def _make_property(name: str) -> property:
+    def getter(self):
+        return self._get_stable_property(name)
+
+    # Read-only like `__getattr__`; properties are set with `proxy[name] = value`
+    return property(getter, doc=f'The `{name}` property of the OSA object.')
+
+
+def make_proxy_classes(classes: dict[str, list[str]],
+                       bases: Optional[dict[str, type[OSAObjProxy]]] = None) -> dict[str, type[OSAObjProxy]]:
+    """Synthesize a proxy class with real properties for every class of a scripting definition.
+
+    The properties behave like `DefaultOSAObjProxy.__getattr__`, but are resolved through
+    normal descriptor lookup instead of the `__getattr__` fallback.
+
+    Args:
+        classes: JXA property names keyed by JXA class name, as returned by `parse_sdef`
+        bases: Base class to use per class name, which must derive from `DefaultOSAObjProxy`.
+            `DefaultOSAObjProxy` is used for the other classes.
+
+    Returns:
+        dict: The synthesized classes keyed by JXA class name
+    """
+    bases = bases or {}
+    class_map = {}
+    for class_name, properties in classes.items():
+        base = bases.get(class_name, DefaultOSAObjProxy)
+        namespace = {'__slots__': ()}
+        for name in properties:
+            # Never shadow the proxy's own API
+            if name.isidentifier() and not hasattr(base, name):
+                namespace[name] = _make_property(name)
+        type_name = class_name[:1].upper() + class_name[1:] + 'Proxy'
+        class_map[class_name] = type(type_name, (base,), namespace)
+    return class_map
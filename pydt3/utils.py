@@ -1,14 +1,21 @@
 import weakref
 import functools
 
+from collections import OrderedDict
+
+# Marks the start of the keyword arguments in a cache key
+kwd_mark = object()
+
 def weak_lru(maxsize=128, typed=False):
     """LRU Cache decorator that keeps a weak reference to "self".
     
     This is a specialized version of functools.lru_cache that prevents memory leaks
     when caching method calls on objects by storing only weak references to the objects.
+    Each object gets its own LRU cache of at most `maxsize` entries, which is dropped
+    as soon as the object is garbage collected.
     
     Args:
-        maxsize: Maximum size of the cache (default: 128)
+        maxsize: Maximum size of the cache per object, or None for no limit (default: 128)
         typed: Whether different types of arguments should be cached separately (default: False)
         
     Returns:
@@ -22,17 +29,42 @@ def weak_lru(maxsize=128, typed=False):
                 pass
     """
     def wrapper(func):
-        # Create an LRU cache for the inner function
-        @functools.lru_cache(maxsize, typed)
-        def _func(_self, *args, **kwargs):
-            # The actual function call using the weak reference
-            return func(_self(), *args, **kwargs)
+        # Per-object caches keyed by `id(self)`, so a lookup hashes a plain int.
+        # A finalizer removes an object's cache when the object dies, before its id can be reused.
+        caches: dict[int, OrderedDict] = {}
+
+        def make_key(args, kwargs):
+            key = args
+            if kwargs:
+                # Separate keyword from positional arguments, like functools' `kwd_mark`
+                key += (kwd_mark,) + tuple(sorted(kwargs.items()))
+            if typed:
+                key += tuple(type(v) for v in args)
+                if kwargs:
+                    key += tuple(type(v) for _, v in sorted(kwargs.items()))
+            return key
 
         @functools.wraps(func)
         def inner(self, *args, **kwargs):
-            # Create a weak reference to self and pass it to the cached function
-            return _func(weakref.ref(self), *args, **kwargs)
+            self_id = id(self)
+            cache = caches.get(self_id)
+            if cache is None:
+                cache = caches[self_id] = OrderedDict()
+                weakref.finalize(self, caches.pop, self_id, None)
+            key = make_key(args, kwargs)
+            try:
+                result = cache[key]
+            except KeyError:
+                pass
+            else:
+                cache.move_to_end(key)
+                return result
+            result = cache[key] = func(self, *args, **kwargs)
+            if maxsize is not None and len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
 
+        inner.cache_clear = caches.clear
         return inner
 
     return wrapper
@@ -0,0 +1,22 @@
+"""Optional build step that compiles the proxy hot path with Cython.
+
+All package metadata lives in pyproject.toml. When Cython or a C compiler is not
+available, the pure-Python `pydt3/objproxy.py` is installed and used as is.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    # Annotations are documentation in this module, not C types, so keep Python semantics
+    ext_modules = cythonize(
+        ['pydt3/objproxy.py'],
+        compiler_directives={'language_level': 3, 'annotation_typing': False},
+    )
+    for ext in ext_modules:
+        # Fall back to the pure-Python module if compilation fails
+        ext.optional = True
+
+setup(ext_modules=ext_modules)
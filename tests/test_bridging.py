@@ -1,7 +1,9 @@
+import asyncio
 import unittest
 import logging
 
 from pydt3.application import Application
+from pydt3.async_proxy import AsyncApplication
 from pydt3.apps.devonthink.database import Database
 from pydt3.helper_bridging import OSAObjArray, HelperScript
 
@@ -20,4 +22,31 @@ class TestBridging(unittest.TestCase):
         items = self.app.items
         self.assertTrue(isinstance(items, OSAObjArray))
         for item in items:
-            print(item.name)
\ No newline at end of file
+            print(item.name)
+
+    def test_osa_obj_array_slice(self):
+        items = self.app.items
+        self.assertEqual(len(items[:2]), min(2, len(items)))
+        self.assertEqual(len(list(items)), len(items))
+
+    def test_osa_obj_array_select(self):
+        items = self.app.items
+        rows = items.select(['name'])
+        self.assertEqual(len(rows), len(items))
+        self.assertTrue(all(isinstance(row['name'], str) for row in rows))
+
+    def test_prefetch(self):
+        with self.app.batch(['name', 'frontmost'], evaluate=True):
+            self.assertEqual(self.app.name, 'Finder')
+            self.assertTrue(isinstance(self.app.frontmost, bool))
+        self.assertIsNone(self.app._prefetch_call_cache)
+
+    def test_async_application(self):
+        app = AsyncApplication('Finder')
+
+        async def gather():
+            return await asyncio.gather(app.name, app.frontmost)
+
+        name, frontmost = asyncio.run(gather())
+        self.assertEqual(name, 'Finder')
+        self.assertTrue(isinstance(frontmost, bool))
@@ -0,0 +1,105 @@
+import json
+import unittest
+
+from pydt3.helper_bridging import HelperScript
+from pydt3.objproxy import DefaultOSAObjProxy
+
+
+class StubScript(HelperScript):
+    """Records calls instead of running them in JXA."""
+
+    def __init__(self):
+        super().__init__(None)
+        self.calls = []
+
+    def _call_str(self, func_name: str, arg: str):
+        self.calls.append((func_name, json.loads(arg)))
+        if func_name == 'getApplication':
+            return json.dumps({'type': 'reference', 'objId': 1, 'gen': 1,
+                               'app': 'Test', 'className': 'application'})
+        return json.dumps({'type': 'plain', 'data': None})
+
+    def calls_to(self, func_name: str) -> list:
+        return [arg for name, arg in self.calls if name == func_name]
+
+
+class TestApplication(DefaultOSAObjProxy):
+    __slots__ = ()
+
+
+class TestGetApplication(unittest.TestCase):
+    def tearDown(self):
+        HelperScript._class_map.pop('Test', None)
+        HelperScript.determine_class.cache_clear()
+
+    def test_application_is_cached(self):
+        script = StubScript()
+        app = script.get_application('Test')
+        self.assertIs(script.get_application('Test'), app)
+        self.assertEqual(len(script.calls_to('getApplication')), 1)
+
+    def test_class_map_registration_invalidates_cache(self):
+        script = StubScript()
+        self.assertNotIsInstance(script.get_application('Test'), TestApplication)
+        HelperScript.register_class_map('Test', {'application': TestApplication})
+        self.assertIsInstance(script.get_application('Test'), TestApplication)
+
+
+def reference(obj_id: int, generation: int) -> dict:
+    return {'type': 'reference', 'objId': obj_id, 'gen': generation, 'className': None}
+
+
+class TestReleases(unittest.TestCase):
+    def setUp(self):
+        self.script = StubScript()
+        # Flush only when asked to, unless a test lowers the batch size
+        self.script.RELEASE_BATCH_INTERVAL = float('inf')
+
+    def test_release_is_deferred(self):
+        proxy = self.script._unwrap_from_json(reference(5, 1))
+        del proxy
+        self.assertEqual(self.script._pending_release, {5})
+        self.assertEqual(self.script.calls_to('releaseObjectsWithIds'), [])
+
+    def test_full_batch_is_flushed(self):
+        self.script.RELEASE_BATCH_SIZE = 2
+        proxies = [self.script._unwrap_from_json(reference(i, 1)) for i in (5, 6)]
+        del proxies
+        releases = self.script.calls_to('releaseObjectsWithIds')
+        self.assertEqual(len(releases), 1)
+        self.assertEqual(sorted(item['data'] for item in releases[0]['data']['ids']['data']), [5, 6])
+        self.assertEqual(self.script._pending_release, set())
+
+    def test_referenced_again_cancels_release(self):
+        proxy = self.script._unwrap_from_json(reference(5, 1))
+        del proxy
+        proxy = self.script._unwrap_from_json(reference(5, 2))
+        self.assertEqual(self.script._pending_release, set())
+        self.assertEqual(self.script._osaobj_rc[5], 1)
+
+    def test_release_carries_latest_generation(self):
+        proxy = self.script._unwrap_from_json(reference(5, 3))
+        # A stale response never lowers the generation
+        self.script._unwrap_from_json(reference(5, 2))
+        del proxy
+        self.script.flush_pending_releases()
+        release = self.script.calls_to('releaseObjectsWithIds')[0]['data']
+        self.assertEqual(release['ids']['data'], [{'type': 'plain', 'data': 5}])
+        self.assertEqual(release['generations']['data'], [{'type': 'plain', 'data': 3}])
+
+    def test_rebind_to_same_object_keeps_it(self):
+        proxy = self.script._unwrap_from_json(reference(5, 1))
+        proxy.bind(self.script, 5, None)
+        self.assertEqual(self.script._osaobj_rc[5], 1)
+        self.assertEqual(self.script._pending_release, set())
+
+    def test_rebind_releases_last_reference(self):
+        proxy = DefaultOSAObjProxy(self.script, 5)
+        proxy.bind(self.script, 6, None)
+        self.assertEqual(self.script._osaobj_rc[5], 0)
+        self.assertEqual(self.script._osaobj_rc[6], 1)
+        self.assertEqual(self.script._pending_release, {5})
+
+
+if __name__ == '__main__':
+    unittest.main()
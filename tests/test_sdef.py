@@ -0,0 +1,64 @@
+import unittest
+
+from pydt3.objproxy import DefaultOSAObjProxy
+from pydt3.sdef import jxa_name, parse_sdef, make_proxy_classes
+
+
+SDEF = '''<?xml version="1.0" encoding="UTF-8"?>
+<dictionary title="Test">
+    <suite name="Test Suite" code="TeSt">
+        <class name="item" code="cobj" plural="items">
+            <property name="name" code="pnam" type="text"/>
+            <property name="ID" code="ID  " type="integer"/>
+        </class>
+        <class name="record" code="DTrc" inherits="item">
+            <property name="URL" code="pURL" type="text"/>
+            <property name="MIME type" code="MIME" type="text"/>
+            <element type="smart group"/>
+        </class>
+        <class name="smart group" code="DTsg" plural="smart groups">
+            <property name="search predicates" code="SPrd" type="text"/>
+        </class>
+        <class-extension extends="record">
+            <property name="plain text" code="pPTx" type="text"/>
+        </class-extension>
+    </suite>
+</dictionary>
+'''
+
+
+class TestSdef(unittest.TestCase):
+    def test_jxa_name(self):
+        self.assertEqual(jxa_name('name'), 'name')
+        self.assertEqual(jxa_name('plain text'), 'plainText')
+        self.assertEqual(jxa_name('URL'), 'url')
+        self.assertEqual(jxa_name('ID'), 'id')
+        self.assertEqual(jxa_name('MIME type'), 'mimeType')
+
+    def test_parse_sdef(self):
+        classes = parse_sdef(SDEF)
+        self.assertEqual(classes['item'], ['name', 'id'])
+        self.assertEqual(classes['record'], ['name', 'id', 'url', 'mimeType', 'smartGroups', 'plainText'])
+        self.assertEqual(classes['smartGroup'], ['searchPredicates'])
+
+    def test_make_proxy_classes(self):
+        class_map = make_proxy_classes({'record': ['name', 'url', 'bind', 'not an identifier']})
+        record_cls = class_map['record']
+        self.assertEqual(record_cls.__name__, 'RecordProxy')
+        self.assertTrue(issubclass(record_cls, DefaultOSAObjProxy))
+        self.assertIsInstance(record_cls.__dict__['url'], property)
+        # The proxy's own API is never shadowed
+        self.assertNotIn('bind', record_cls.__dict__)
+        self.assertNotIn('not an identifier', record_cls.__dict__)
+
+    def test_make_proxy_classes_bases(self):
+        class Record(DefaultOSAObjProxy):
+            __slots__ = ()
+
+        class_map = make_proxy_classes({'record': ['name'], 'item': []}, bases={'record': Record})
+        self.assertTrue(issubclass(class_map['record'], Record))
+        self.assertIs(class_map['item'].__bases__[0], DefaultOSAObjProxy)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import gc
+import unittest
+import weakref
+
+from pydt3.utils import weak_lru
+
+
+class Result:
+    pass
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    @weak_lru(maxsize=2)
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        return (args, kwargs)
+
+    @weak_lru()
+    def get_result(self):
+        return Result()
+
+    @weak_lru(typed=True)
+    def get_typed(self, value):
+        self.calls += 1
+        return value
+
+
+class TestWeakLru(unittest.TestCase):
+    def test_cache_hit(self):
+        counter = Counter()
+        self.assertIs(counter.get(1), counter.get(1))
+        self.assertEqual(counter.calls, 1)
+
+    def test_args_and_kwargs_are_separate_keys(self):
+        counter = Counter()
+        self.assertEqual(counter.get(('b', 2)), ((('b', 2),), {}))
+        self.assertEqual(counter.get(b=2), ((), {'b': 2}))
+        self.assertEqual(counter.calls, 2)
+
+    def test_typed(self):
+        counter = Counter()
+        self.assertIsInstance(counter.get_typed(1), int)
+        self.assertIsInstance(counter.get_typed(1.0), float)
+        self.assertEqual(counter.calls, 2)
+
+    def test_maxsize_per_object(self):
+        first, second = Counter(), Counter()
+        first.get(1)
+        first.get(2)
+        second.get(3)
+        first.get(1)
+        # Evicts 2, the least recently used entry of `first` only
+        first.get(4)
+        self.assertEqual(first.calls, 3)
+        first.get(1)
+        self.assertEqual(first.calls, 3)
+        first.get(2)
+        self.assertEqual(first.calls, 4)
+        second.get(3)
+        self.assertEqual(second.calls, 1)
+
+    def test_cache_dropped_on_gc(self):
+        counter = Counter()
+        result = weakref.ref(counter.get_result())
+        self.assertIsNotNone(result())
+        del counter
+        gc.collect()
+        # The cached result is only referenced by the object's cache
+        self.assertIsNone(result())
+
+if __name__ == '__main__':
+    unittest.main()